@@ -1,8 +1,116 @@
 import math
+import os
+import sys
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
 
+# NumPy is optional: mapcar falls back to its Python loop without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional: defun falls back to the interpreted closure without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Raised internally when a defun body cannot be translated for JIT compilation
+class _JitUnsupported(Exception):
+    pass
+
+# Inputs smaller than this are mapped inline; the thread handoff would cost
+# more than it saves
+_MIN_PARALLEL_ITEMS = 8
+
+# Shared worker pool for pmap, created on first use
+_POOL = None
+
+def _get_pool():
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+# Numeric builtins with a NumPy equivalent, used to vectorize mapcar over
+# homogeneous integer lists. '/', 'sqrt' and 'pow' are left out because their
+# NumPy counterparts do not match this interpreter's Fraction/int semantics.
+_NUMPY_OPS = {
+    '+': 'add',
+    '-': 'subtract',
+    '*': 'multiply',
+    '>': 'greater',
+    '<': 'less',
+    '=': 'equal',
+    '!=': 'not_equal',
+}
+
+# A constant-time view of the tail of a list, returned by cdr so that walking
+# a list is O(n) overall instead of O(n^2) in slice copies. Supports the
+# operations the interpreter performs on list data (length, indexing,
+# iteration, equality against lists and other views).
+class ListView:
+    __slots__ = ('_items', '_start')
+
+    def __init__(self, items, start):
+        self._items = items
+        self._start = start
+
+    def __len__(self):
+        return len(self._items) - self._start
+
+    def __iter__(self):
+        items = self._items
+        for index in range(self._start, len(items)):
+            yield items[index]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("list index out of range")
+        return self._items[self._start + index]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, ListView)):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __repr__(self):
+        return repr(list(self))
+
+# Lisp-style truth: everything is true except false and NIL (None/empty list)
+def _is_truthy(value):
+    return value is not False and value is not None and value != []
+
+# 32-bit signed integer bounds, hoisted so arithmetic can compare inline
+_INT_MIN = -2_147_483_648
+_INT_MAX = 2_147_483_647
+
+# Deterministic builtins whose results can be cached per operand tuple;
+# interned to match the symbols the parser produces
+_PURE_OPS = frozenset(sys.intern(op) for op in
+                      {'+', '-', '*', '/', 'sqrt', 'pow',
+                       '>', '<', '=', '!=', 'and', 'or', 'not',
+                       'car', 'cdr', 'cons'})
+
 class Environment:
-    def __init__(self):
+    # An existing variables mapping, functions dict, compiled-node cache and
+    # pure-op memo can be passed in so function-call frames share state
+    # instead of rebuilding the defaults.
+    def __init__(self, variables=None, functions=None, compiled=None, memo=None):
+        if variables is not None and functions is not None:
+            self.variables = variables
+            self.functions = functions
+            self._pure_ops = _PURE_OPS
+            self._memo = memo if memo is not None else {}
+            self._compiled = compiled if compiled is not None else {}
+            return
         self.variables = {
                     'T': True,
                     'NIL': None
@@ -28,40 +136,129 @@ class Environment:
                     'if': self.if_cond,
                     'set!': self.set,
                     'defun': self.defun,
-                    'mapcar': self.mapcar
+                    'mapcar': self.mapcar,
+                    'pmap': self.pmap
                 }
-        
+        # Intern the operator names: symbols like '+' and 'set!' are not
+        # identifier-shaped, so CPython does not intern them automatically,
+        # and the parser interns every symbol it emits — matching keys here
+        # makes evaluator lookups compare by pointer
+        self.functions = {sys.intern(key): value for key, value in self.functions.items()}
+        self._pure_ops = _PURE_OPS
+        self._memo = {}  # (operator, operands) -> result, cleared on state changes
+        self._compiled = {}  # id(AST node) -> (node, closure), node kept alive so its id stays unique
+
     # Evaluates a given expression in the current environment.
     # Handles variables, quoted expressions, and function calls.
     # Returns the evaluated result of the expression.
     def evaluate_expression(self, expression):
+        # Fast path for literals: the parser already produced ints (and
+        # evaluation produces bools), so skip the variable lookup entirely
+        t = type(expression)
+        if t is int or t is bool:
+            return expression
+
+        variables = self.variables  # Bind once, avoids an attribute load per lookup
+
         if isinstance(expression, list):
-            element = str(expression[0])  # Convert the first element to string
-
-            # Check if the first element is a variable and return its value
-            if element in self.variables:
-                return self.variables[element]
-            
-            # Check for 'quote' expression
-            if element == 'quote':
-                if len(expression) != 2:
-                    raise SyntaxError("Malformed quote expression")
-                return expression[1]  # Return the quoted value directly
-            
-            # Check if the first element is a valid function name
-            if not isinstance(expression[0], str):
-                raise SyntaxError(f"Invalid function call: {expression}")
+            # Reuse the closure compiled for this AST node; thanks to the
+            # parse cache and recursion, the same node is evaluated many times
+            cached = self._compiled.get(id(expression))
+            if cached is None:
+                closure = self.compile(expression)
+                self._compiled[id(expression)] = (expression, closure)
+            else:
+                closure = cached[1]
+            return closure(self)
 
-            # Evaluate a function call by passing the expression to a separate method
-            # This will handle looking up the function and applying the operands
-            return self.evaluate_function_call(expression)
-        
         else:
             # If it's not a list, check if it's a variable or return the value
-            if expression in self.variables:
-                return self.variables[expression]
+            if expression in variables:
+                return variables[expression]
             return expression
 
+    # Compiles an AST node into a closure taking the evaluating environment.
+    # Branch structure, operand counts and builtin lookups are resolved once
+    # at compile time, so repeated evaluation of the same node (recursive
+    # functions, reused REPL input) skips the per-visit dispatch work.
+    def compile(self, expression):
+        t = type(expression)
+        if t is int or t is bool:
+            return lambda env: expression
+
+        if not isinstance(expression, list):
+            symbol = expression
+            def lookup(env):
+                variables = env.variables
+                if symbol in variables:
+                    return variables[symbol]
+                return symbol
+            return lookup
+
+        first = expression[0]
+        element = str(first)
+
+        if not isinstance(first, str):
+            def body(env):
+                raise SyntaxError(f"Invalid function call: {expression}")
+        elif element == 'quote':
+            if len(expression) != 2:
+                raise SyntaxError("Malformed quote expression")
+            quoted = expression[1]
+            def body(env):
+                return quoted
+        elif element == 'if' and len(expression) == 4:
+            # Branches are compiled but only the taken one is evaluated
+            condition = self.compile(expression[1])
+            conseq = self.compile(expression[2])
+            alt = self.compile(expression[3])
+            def body(env):
+                if _is_truthy(condition(env)):
+                    return conseq(env)
+                return alt(env)
+        elif element in ('and', 'or') and len(expression) == 3:
+            # Short-circuit: the second operand runs only when needed
+            left = self.compile(expression[1])
+            right = self.compile(expression[2])
+            wanted = element == 'or'
+            def body(env):
+                first = left(env)
+                if _is_truthy(first) is wanted:
+                    return first
+                return right(env)
+        elif element in ('set!', 'defun', 'mapcar', 'pmap'):
+            # Special forms keep their interpreted handling
+            def body(env):
+                return env.evaluate_function_call(expression)
+        else:
+            function = self.functions.get(element)
+            if function is None:
+                # Not defined yet (e.g. forward reference); resolve per call.
+                # defun clears the compiled cache, so the node is recompiled
+                # once the function exists
+                def body(env):
+                    return env.evaluate_function_call(expression)
+            elif element in _PURE_OPS:
+                # Deterministic builtin: route through the result memo so
+                # repeated operand tuples skip the arithmetic
+                operand_closures = [self.compile(operand) for operand in expression[1:]]
+                def body(env):
+                    return env._call_pure(element, function,
+                                          [closure(env) for closure in operand_closures])
+            else:
+                operand_closures = [self.compile(operand) for operand in expression[1:]]
+                def body(env):
+                    return function(*[closure(env) for closure in operand_closures])
+
+        # The head may be shadowed by a variable at run time, in which case
+        # the whole form evaluates to that variable's value
+        def compiled(env):
+            variables = env.variables
+            if element in variables:
+                return variables[element]
+            return body(env)
+        return compiled
+
     # Evaluates a function call expression, which includes:
     # - Checking if the operator is valid (function name).
     # - Handling special operators like 'set!' (variable assignment) and 'defun' (function definition).
@@ -71,10 +268,12 @@ class Environment:
         # Extract the operator (function name) and operands (arguments) from the expression
         operator, operands = expression[0], expression[1:]
 
-        # Check if the operator (function name) is a known function
-        if operator not in self.functions:
+        # Resolve the operator in a single dict lookup; the bound function is
+        # reused below instead of re-indexing self.functions per dispatch
+        function = self.functions.get(operator)
+        if function is None:
             raise NameError(f"Unknown function: {operator}")
-        
+
         # Special handling for 'set!' operator: Assigns a new value to an existing variable
         if operator == 'set!':
             if len(operands) != 2:
@@ -83,57 +282,103 @@ class Environment:
         
         # Special handling for 'defun' operator: Defines a new function
         if operator == 'defun':
-            return self.functions[operator](*operands)
-        
-        # Special handling for 'mapcar'
-        if operator == 'mapcar':
+            return function(*operands)
+
+        # 'if', 'and' and 'or' never reach this method: compile handles their
+        # short-circuit evaluation directly (see the if/and/or branches there)
+
+        # Special handling for 'mapcar' and its parallel variant 'pmap'
+        if operator == 'mapcar' or operator == 'pmap':
             if len(operands) < 2:
-                raise SyntaxError("mapcar requires at least one function and one list argument")
-            
+                raise SyntaxError(f"{operator} requires at least one function and one list argument")
+
             # Evaluate the function but keep the lists unchanged
             func = self.evaluate_expression(operands[0])
             lists = [self.evaluate_expression(lst) for lst in operands[1:]]
 
             # Ensure all operands after the function are lists
-            if not all(isinstance(lst, list) for lst in lists):
-                raise TypeError("mapcar requires all arguments after the function to be lists")
+            if not all(isinstance(lst, (list, ListView)) for lst in lists):
+                raise TypeError(f"{operator} requires all arguments after the function to be lists")
 
-            return self.mapcar(func, *lists)
+            return function(func, *lists)
 
         # Evaluate operands and pass them to the function
         evaluated_operands = [self.evaluate_expression(operand) for operand in operands]
-        
-        # Call the function (retrieved from the functions dictionary) with the evaluated operands and return the result
-        return self.functions[operator](*evaluated_operands)
+
+        # Pure builtins: reuse a cached result for repeated operand tuples,
+        # which skips dispatch and arithmetic in recursive user functions
+        if operator in self._pure_ops:
+            return self._call_pure(operator, function, evaluated_operands)
+
+        # Call the resolved function with the evaluated operands and return the result
+        return function(*evaluated_operands)
+
+    # Calls a deterministic builtin through the result memo shared by this
+    # environment and its call frames. Each operand is keyed together with its
+    # type, since values that hash alike but differ in kind (True vs 1) must
+    # not share a cache entry.
+    def _call_pure(self, operator, function, evaluated_operands):
+        key = (operator,) + tuple((type(operand), operand) for operand in evaluated_operands)
+        try:
+            if key in self._memo:
+                return self._memo[key]
+        except TypeError:
+            key = None  # Unhashable operand (e.g. a list), skip the cache
+        result = function(*evaluated_operands)
+        if key is not None:
+            self._memo[key] = result
+        return result
 
     # Ensures the value fits within the 32-bit signed integer range
     def check_32bit(self, value):
-        INT_MIN = -2_147_483_648
-        INT_MAX = 2_147_483_647
-        if value < INT_MIN or value > INT_MAX:
+        if value < _INT_MIN or value > _INT_MAX:
             raise OverflowError(f"Integer overflow: {value}")
         return value
-    
 
-    # Mathematical operations
+
+    # Mathematical operations. The hottest ops compare against the bounds
+    # inline rather than paying a method call per operation.
     def add(self, *args):
-        result = sum(args)
-        return self.check_32bit(result)
-    
+        # Two operands are the overwhelmingly common case; skip sum()'s
+        # iterator setup for it
+        if len(args) == 2:
+            result = args[0] + args[1]
+        else:
+            result = sum(args)
+        if result < _INT_MIN or result > _INT_MAX:
+            raise OverflowError(f"Integer overflow: {result}")
+        return result
+
     def subtract(self, a, b):
         result = a - b
-        return self.check_32bit(result)
-    
+        if result < _INT_MIN or result > _INT_MAX:
+            raise OverflowError(f"Integer overflow: {result}")
+        return result
+
     def multiply(self, *args):
+        # Same binary fast path as add
+        if len(args) == 2:
+            result = args[0] * args[1]
+            if result < _INT_MIN or result > _INT_MAX:
+                raise OverflowError(f"Integer overflow: {result}")
+            return result
         result = 1
         for arg in args:
             result *= arg
-            self.check_32bit(result)  # Check for overflow at each step
+            # Check for overflow at each step
+            if result < _INT_MIN or result > _INT_MAX:
+                raise OverflowError(f"Integer overflow: {result}")
         return result
 
     def divide(self, a, b):
         if b == 0:
             raise ZeroDivisionError("Division by zero is not allowed")
+        # Exact integer division avoids constructing a Fraction (and its GCD
+        # reduction) in the common case; inexact results still promote
+        if isinstance(a, int) and isinstance(b, int):
+            quotient, remainder = divmod(a, b)
+            if remainder == 0:
+                return self.check_32bit(quotient)
         result = Fraction(a, b)
         return self.check_32bit(result)
     
@@ -175,21 +420,24 @@ class Environment:
 
     # List operations
     def car(self, a):
-        if isinstance(a, list):
+        if isinstance(a, (list, ListView)):
             if a == []:
                 return None
             return a[0]
         else:
             return a
-        
+
     def cdr(self, a):
-        if isinstance(a, list):
+        if isinstance(a, (list, ListView)):
             if a == []:
                 return None
-            return a[1:]
+            # Advance a view over the backing list instead of copying the tail
+            if isinstance(a, ListView):
+                return ListView(a._items, a._start + 1)
+            return ListView(a, 1)
         else:
             raise SyntaxError("Argument for cdr is not a list")
-        
+
     def cons(self, a, b):
         if a == []:
             a = None
@@ -199,8 +447,8 @@ class Environment:
         if a is None and b is None:
             return None  # Equivalent to '() in Lisp'
 
-        if isinstance(b, list):
-            return [a] + b  # Creates a new list instead of modifying b
+        if isinstance(b, (list, ListView)):
+            return [a, *b]  # Creates a new list instead of modifying b
 
         return [a, '.', b]  # Equivalent to (a . b) in Lisp
 
@@ -210,10 +458,11 @@ class Environment:
         if not isinstance(var_name, str):
             raise TypeError("Variable name must be a string")
         self.variables[var_name] = value
+        self._memo.clear()  # Environment changed, cached results may be stale
         return var_name
     
     def if_cond(self, condition, conseq, alt):
-        if condition is True:
+        if _is_truthy(condition):
             return conseq
         else:
             return alt
@@ -226,6 +475,7 @@ class Environment:
             raise NameError(f"Variable '{var_name}' is not defined")
 
         self.variables[var_name] = value  # Modify the stored variable
+        self._memo.clear()  # Environment changed, cached results may be stale
         return var_name  # Return variable name for confirmation
     
     def defun(self, name, params, body):
@@ -237,30 +487,171 @@ class Environment:
         if not isinstance(params, list):
             raise SyntaxError("Function parameters must be a list")
 
-        # Define the user function that will be called later. Uses static scoping
+        # Define the user function that will be called later. Uses static
+        # scoping. Tail-recursive calls are executed as a loop (trampoline)
+        # so deep recursion does not grow the Python stack.
         def user_function(*args):
-            # Ensure the correct number of arguments are passed to the function
+            while True:
+                # Ensure the correct number of arguments are passed to the function
+                if len(args) != len(params):
+                    raise TypeError(f"Function '{name}' expects {len(params)} arguments, got {len(args)}")
+
+                # Chain a frame holding just the parameter bindings over the
+                # defining environment's variables: O(params) per call instead of
+                # copying every variable, and definitions made after the defun
+                # remain visible inside the function
+                frame = ChainMap(dict(zip(params, args)), self.variables)
+                local_env = Environment(frame, self.functions, self._compiled, self._memo)
+
+                # Walk tail-position if chains lazily so the expression in
+                # tail position is known before anything else is evaluated.
+                # A head bound as a variable shadows the form (same rule the
+                # evaluator applies), so such expressions fall through to
+                # normal evaluation instead.
+                expr = body
+                while (isinstance(expr, list) and len(expr) == 4 and expr[0] == 'if'
+                       and 'if' not in frame):
+                    condition = local_env.evaluate_expression(expr[1])
+                    expr = expr[2] if _is_truthy(condition) else expr[3]
+
+                # Self-call in tail position: rebind the parameters and loop
+                # instead of recursing into another Python frame
+                if (isinstance(expr, list) and expr and expr[0] == name
+                        and name not in frame):
+                    args = tuple(local_env.evaluate_expression(operand) for operand in expr[1:])
+                    continue
+
+                # Evaluate the remaining (non-tail-call) expression in this frame
+                return local_env.evaluate_expression(expr)
+
+        # Save function in the environment. Pure numeric bodies are compiled
+        # to native code with Numba when available; the jitted wrapper keeps
+        # user_function as its fallback for operands outside the native
+        # subset, so behavior does not depend on whether numba is importable.
+        jitted = self._try_jit(name, params, body, user_function)
+        self.functions[name] = jitted if jitted is not None else user_function
+        self._memo.clear()  # A builtin may have been shadowed, drop cached results
+        self._compiled.clear()  # Compiled closures may have baked in the old binding
+        return name
+    
+    # Attempts to compile a pure numeric defun body to native code with Numba.
+    # Returns a wrapped compiled function that delegates non-integer calls to
+    # the given interpreted fallback, or None when Numba is unavailable or the
+    # body uses anything beyond ints, parameters, comparisons, +/-/*/pow,
+    # if with a comparison condition, and self-calls.
+    def _try_jit(self, name, params, body, fallback):
+        if njit is None:
+            return None
+        if not (isinstance(name, str) and name.isidentifier()):
+            return None
+        if not all(isinstance(param, str) and param.isidentifier() for param in params):
+            return None
+
+        try:
+            expr_src = self._jit_translate(body, name, set(params))
+        except _JitUnsupported:
+            return None
+
+        source = f"def {name}({', '.join(params)}):\n    return {expr_src}"
+        namespace = {}
+        try:
+            exec(source, namespace)
+            compiled = njit(namespace[name])
+            namespace[name] = compiled  # Recursive self-calls resolve to the compiled version
+        except Exception:
+            return None
+
+        def jitted(*args):
             if len(args) != len(params):
                 raise TypeError(f"Function '{name}' expects {len(params)} arguments, got {len(args)}")
+            if not all(isinstance(arg, int) for arg in args):
+                # Non-integer operands (e.g. Fractions) keep interpreted semantics
+                return fallback(*args)
+            # The final result still respects the 32-bit range; intermediate
+            # native values are not range-checked
+            result = compiled(*args)
+            if isinstance(result, float) and result.is_integer():
+                result = int(result)
+            return self.check_32bit(result) if isinstance(result, int) else result
+
+        return jitted
+
+    # Translates a numeric body expression to Python source for JIT
+    # compilation, raising _JitUnsupported for anything outside the subset.
+    def _jit_translate(self, node, name, param_names):
+        if type(node) is int:
+            return repr(node)
+        if isinstance(node, str):
+            if node in param_names:
+                return node
+            raise _JitUnsupported(node)
+        if isinstance(node, list) and node:
+            head = node[0]
+            operands = node[1:]
+            if head == 'if' and len(operands) == 3:
+                # Only comparison conditions translate faithfully: the
+                # interpreter's if does not treat arbitrary ints as truthy
+                if not (isinstance(operands[0], list) and operands[0]
+                        and operands[0][0] in ('<', '>', '=', '!=')):
+                    raise _JitUnsupported(node)
+                cond, conseq, alt = (self._jit_translate(operand, name, param_names)
+                                     for operand in operands)
+                return f"({conseq} if {cond} else {alt})"
+            translated = [self._jit_translate(operand, name, param_names) for operand in operands]
+            if head in ('+', '*') and len(translated) >= 2:
+                return '(' + f' {head} '.join(translated) + ')'
+            if head in ('-', '<', '>') and len(translated) == 2:
+                return f"({translated[0]} {head} {translated[1]})"
+            if head == '=' and len(translated) == 2:
+                return f"({translated[0]} == {translated[1]})"
+            if head == '!=' and len(translated) == 2:
+                return f"({translated[0]} != {translated[1]})"
+            if head == 'pow' and len(translated) == 2:
+                return f"({translated[0]} ** {translated[1]})"
+            if head == name:
+                return f"{name}({', '.join(translated)})"
+        raise _JitUnsupported(node)
 
-            # Create a new environment for this function call
-            local_env = Environment()
-            local_env.variables = self.variables.copy()  # Copy the current environment's variables
-            local_env.functions = self.functions  # Preserve existing function definitions
-
-            # Bind the arguments to the function parameters in the new environment
-            for param, arg in zip(params, args):
-                local_env.variables[param] = arg
-
-            # Evaluate function body within this new environment
-            return local_env.evaluate_expression(body)
-
-        # Save function in the environment
-        self.functions[name] = user_function
-        return name
-    
     # Applies the given function across multiple lists, returning a new list of results.
     def mapcar(self, func, *lists):
+        # Try a single vectorized NumPy operation for numeric builtins
+        vectorized = self._mapcar_vectorized(func, lists)
+        if vectorized is not None:
+            return vectorized
+
         # Combines list into one iterable of tuples. These tuples serve as the arguments to be passed to the specified function
         zipped_list = list(zip(*lists))
         return [self.functions[func](*values) for values in zipped_list]
+
+    # Performs mapcar as one NumPy array operation when the function is a
+    # numeric builtin and both lists hold plain integers of equal length.
+    # Returns None when the fast path does not apply.
+    def _mapcar_vectorized(self, func, lists):
+        if np is None or func not in _NUMPY_OPS or len(lists) != 2:
+            return None
+        for lst in lists:
+            if not isinstance(lst, (list, ListView)) or len(lst) != len(lists[0]):
+                return None
+            if not all(type(item) is int for item in lst):
+                return None
+
+        arrays = [np.fromiter(lst, dtype=np.int64, count=len(lst)) for lst in lists]
+        result = getattr(np, _NUMPY_OPS[func])(*arrays)
+
+        # Arithmetic results must still respect the 32-bit range
+        if result.dtype.kind != 'b' and result.size:
+            self.check_32bit(int(result.min()))
+            self.check_32bit(int(result.max()))
+        return result.tolist()
+
+    # Parallel variant of mapcar: applies the function across the lists on a
+    # shared thread pool, which pays off when the per-element work is heavy.
+    def pmap(self, func, *lists):
+        zipped_list = list(zip(*lists))
+
+        # Small inputs are cheaper to map inline than to hand to the pool
+        if len(zipped_list) < _MIN_PARALLEL_ITEMS:
+            return self.mapcar(func, *lists)
+
+        function = self.functions[func]
+        return list(_get_pool().map(lambda values: function(*values), zipped_list))
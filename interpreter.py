@@ -1,5 +1,5 @@
 from parser import Parser
-from env import Environment
+from env import Environment, ListView
 
 class Interpreter:
     def __init__(self):
@@ -13,9 +13,10 @@ class Interpreter:
         """
         print("> Welcome to the fancy new Prompt LISP INTERPRETER, type in LISP commands! >")
 
-        try:
-            # Open the result file in append mode to log the output
-            with open("results.file", "a") as result_file:
+        # Open the result file once for the whole session, line-buffered so
+        # each result is flushed as it is written
+        with open("results.file", "a", buffering=1) as result_file:
+            try:
                 while True:
                     # Get user input (LISP expression)
                     tokens_str = input("> ")
@@ -48,12 +49,12 @@ class Interpreter:
                         print(f"Error: {e}")  # Print error but continue execution
                         result_file.write(f"Error: {e}\n")
 
-        except Exception as e:
-            # Handle any errors during evaluation or execution
-            print(f"Fatal error: {e}")
-        finally:
-            # Write EOF to the result file when the loop terminates
-            with open("results.file", "a") as result_file:
+            except Exception as e:
+                # Handle any errors during evaluation or execution
+                print(f"Fatal error: {e}")
+            finally:
+                # Write EOF to the result file when the loop terminates,
+                # reusing the already-open handle
                 result_file.write("EOF\n")
    
     def conv_cell(self, cell):
@@ -65,7 +66,7 @@ class Interpreter:
             return "NIL"
         if cell is True:
             return "T"
-        if isinstance(cell, list):
+        if isinstance(cell, (list, ListView)):
             # Recursively convert each element in the list and join them
             return f"({' '.join(map(self.conv_cell, cell))})"
         
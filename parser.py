@@ -1,88 +1,95 @@
-import re
+import functools
+import sys
 
-class Parser:
-    # Parses the given expression and returns its evaluated representation.
-    def parse_expression(self, expression):
-        expression = expression.strip()  # Remove leading/trailing spaces
-
-        # Check for quotation
-        if expression.startswith("'"):
-            return ['quote', self.parse_expression(expression[1:].strip())]
+# Translation table that pads parentheses with spaces so a single C-level
+# str.split() produces the token stream without involving the regex engine.
+_TRANS = str.maketrans({'(': ' ( ', ')': ' ) '})
 
-        # Check for numbers (positive or negative)
-        if self.is_number(expression):
-            return int(expression)  # Convert valid number string to integer
+# Hash-consing table: structurally identical subtrees are collapsed to one
+# canonical node. Repeated subexpressions then share memory, and the
+# evaluator's per-node caches (keyed on node identity) hit for every
+# occurrence instead of just the first.
+_node_table = {}
 
-        # Check for list expressions (parenthesis)
-        if self.is_list(expression):
-            tokens = self.tokenize(expression)
-            return self.parse_list(tokens[1:-1])  # Parse the list content excluding parentheses
+def _intern_node(node):
+    # Children are already interned (lists complete bottom-up), so identity
+    # stands in for structure and the key is one tuple over the elements
+    key = tuple((0, id(child)) if isinstance(child, list) else (1, child)
+                for child in node)
+    cached = _node_table.get(key)
+    if cached is None:
+        _node_table[key] = node
+        return node
+    return cached
 
-        # Return the symbol itself if not a number or list (variable or function)
-        return expression
-
-    # Checks if the given expression is a valid number (positive or negative).
-    def is_number(self, expression):
-        return expression[0] == '-' and expression[1:].isdigit() or expression.isdigit()
+class Parser:
+    # Parses the given expression and returns its evaluated representation.
+    # Walks the token stream once with an explicit stack: '(' opens a new list,
+    # ')' closes the current one, and quotes wrap the next completed value.
+    # Results are memoized on the input string so retyping an expression in the
+    # REPL skips tokenization and parsing entirely. Returning the same AST
+    # object is safe because the evaluator never mutates parsed expressions.
+    @functools.lru_cache(maxsize=1024)
+    def parse_expression(self, expression):
+        tokens = self.tokenize(expression)
+        if not tokens:
+            raise SyntaxError("Empty expression")
 
-    # Checks if the given expression is a list (enclosed in parentheses).
-    def is_list(self, expression):
-        return expression.startswith('(') and expression.endswith(')')
+        stack = [[]]   # stack[0] collects the top-level expression
+        pending = [0]  # Number of quotes waiting for the next value at each depth
 
-    # Parses a list of tokens and returns the corresponding nested expressions.
-    def parse_list(self, tokens):
-        parsed_tokens = []
-        while tokens:
-            token = tokens.pop(0)  # Get the first token
+        for token in tokens:
+            # Peel leading quotes off the token; each one wraps the next value
+            while token.startswith("'"):
+                pending[-1] += 1
+                token = token[1:]
+            if not token:
+                continue  # Token was a bare quote, applies to whatever comes next
 
             if token == '(':
-                # Nested list, handle recursively
-                sub_expr = self.extract_sublist(tokens)
-                parsed_tokens.append(self.parse_list(sub_expr))
+                stack.append([])
+                pending.append(0)
             elif token == ')':
-                raise SyntaxError("Unexpected closing parenthesis")
-            elif token == "'":
-                # Handle quotation (only applies to the next expression)
-                self.handle_quotation(tokens, parsed_tokens)
+                if len(stack) == 1:
+                    raise SyntaxError("Unexpected closing parenthesis")
+                if pending[-1]:
+                    raise SyntaxError("Unexpected end after quote")
+                completed = _intern_node(stack.pop())
+                pending.pop()
+                self._emit(stack, pending, completed)
             else:
                 # Regular token (either number, symbol, or function)
-                parsed_tokens.append(self.parse_expression(token))
+                self._emit(stack, pending, self._atomize(token))
 
-        return parsed_tokens
-
-    # Handles the processing of quoted expressions (those starting with ').
-    def handle_quotation(self, tokens, parsed_tokens):
-        if not tokens:
+        if len(stack) != 1:
+            raise SyntaxError("Unmatched opening parenthesis")
+        if pending[0]:
             raise SyntaxError("Unexpected end after quote")
-        next_token = tokens.pop(0)  # Get the token after the quote
+        if len(stack[0]) != 1:
+            raise SyntaxError("Expected a single expression")
+        return stack[0][0]
 
-        # Check if the quoted expression is a list
-        if next_token == '(':
-            # If it's a list, extract the entire sublist and parse it recursively
-            sub_expr = self.extract_sublist(tokens)
-            quoted_expr = self.parse_list(sub_expr) # Recursively parse the sublist
-        else:
-            # If it's not a list, just parse the token as an expression
-            quoted_expr = self.parse_expression(next_token)
+    # Appends a completed value to the current list, wrapping it in 'quote'
+    # once per quote that was pending at this depth.
+    def _emit(self, stack, pending, value):
+        while pending[-1]:
+            value = _intern_node(['quote', value])
+            pending[-1] -= 1
+        stack[-1].append(value)
 
-        # Append the quoted expression to the list of parsed tokens
-        parsed_tokens.append(['quote', quoted_expr])
+    # Converts a single token to an integer if possible, otherwise keeps it
+    # as a symbol (variable or function name). int() scans the token once in
+    # C, which beats a separate isdigit pre-check.
+    def _atomize(self, token):
+        try:
+            return int(token)
+        except ValueError:
+            # Intern symbols so the evaluator's dict lookups and equality
+            # checks hit the interned-string fast path (pointer compare)
+            return sys.intern(token)
 
     # Tokenizes the input string into a list of symbols and parentheses.
+    # The translation table is built once at import; no pattern compilation
+    # or regex-cache lookup happens per call.
     def tokenize(self, tokens_str):
-        return re.findall(r'\(|\)|[^\s()]+', tokens_str)
-
-    # Extracts a sublist of tokens from a nested parenthesis expression.
-    def extract_sublist(self, tokens):
-        sub_expr = []
-        depth = 1  # Track nested parentheses
-        while tokens:
-            token = tokens.pop(0)
-            if token == '(':
-                depth += 1  # Deeper level of nesting
-            elif token == ')':
-                depth -= 1
-                if depth == 0:
-                    return sub_expr  # Return the token list when depth is 0 (matching parentheses)
-            sub_expr.append(token)
-        raise SyntaxError("Unmatched opening parenthesis")
\ No newline at end of file
+        return tokens_str.translate(_TRANS).split()